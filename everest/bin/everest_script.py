@@ -1,11 +1,12 @@
 #!/usr/bin/env python
 
 import argparse
-import json
 import logging
 import signal
 from functools import partial
 import threading
+
+import orjson
 from ert.config import ErtConfig
 from ert.storage import open_storage
 
@@ -40,7 +41,15 @@ def everest_entry(args=None):
         logging.getLogger().removeHandler(logging.NullHandler())
 
     logging.info(version_info())
-    logging.debug(json.dumps(options.config.to_dict(), sort_keys=True, indent=2))
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(
+            orjson.dumps(
+                options.config.to_dict(),
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_SORT_KEYS
+                | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        )
 
     if threading.current_thread() is threading.main_thread():
         signal.signal(
@@ -125,9 +134,10 @@ def run_everest(options):
     elif server_state["status"] == ServerStatus.never_run or options.new_run:
         config_dict = options.config.to_dict()
         logger.info("Running everest with config info\n {}".format(config_dict))
-        for fm_job in options.config.forward_model:
-            job_name = fm_job.split()[0]
-            logger.info("Everest forward model contains job {}".format(job_name))
+        if logger.isEnabledFor(logging.INFO):
+            for fm_job in options.config.forward_model:
+                job_name = fm_job.split(maxsplit=1)[0]
+                logger.info("Everest forward model contains job {}".format(job_name))
 
         with PluginSiteConfigEnv():
             ert_config = ErtConfig.from_dict(
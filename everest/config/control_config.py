@@ -201,5 +201,6 @@ sampler to use the same perturbations for each realization.
 
     model_config = ConfigDict(
         extra="forbid",
+        defer_build=True,
         metadata={"doc": """Specification for the control configuration"""},
     )
@@ -1,11 +1,20 @@
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field, NonNegativeInt, PositiveFloat, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    NonNegativeInt,
+    PositiveFloat,
+    field_validator,
+)
 
 from .sampler_config import SamplerConfig
 
 
-class ControlVariableConfig(BaseModel, extra="forbid"):  # type: ignore
+class ControlVariableConfig(BaseModel):  # type: ignore
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
     name: str = Field(description="Control variable name")
     initial_guess: Optional[float] = Field(
         default=None,
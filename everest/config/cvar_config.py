@@ -27,11 +27,10 @@ This option is exclusive with the **number_of_realizations** option.
         """,
     )
 
-    @model_validator(mode="before")
-    @classmethod
-    def validate_mutex_nreals_percentile(cls, values):  # pylint: disable=E0213
-        has_nreals = values.get("number_of_realizations") is not None
-        has_percentile = values.get("percentile") is not None
+    @model_validator(mode="after")
+    def validate_mutex_nreals_percentile(self):  # pylint: disable=E0213
+        has_nreals = self.number_of_realizations is not None
+        has_percentile = self.percentile is not None
 
         if not (has_nreals ^ has_percentile):
             raise ValueError(
@@ -39,10 +38,11 @@ This option is exclusive with the **number_of_realizations** option.
                 " following: number_of_realizations, percentile"
             )
 
-        return values
+        return self
 
     model_config = ConfigDict(
         extra="forbid",
+        defer_build=True,
         metadata={
             "doc": """Directs the optimizer to use CVaR estimation.
 
@@ -1,11 +1,13 @@
 from typing import Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from everest.config.validation_utils import check_path_valid
 
 
-class EnvironmentConfig(BaseModel, extra="forbid"):  # type: ignore
+class EnvironmentConfig(BaseModel):  # type: ignore
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
     simulation_folder: str = Field(
         default="simulation_folder", description="Folder used for simulation by Everest"
     )
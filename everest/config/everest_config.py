@@ -198,7 +198,7 @@ and environment variables are exposed in the form 'os.NAME', for example:
         default=None, description="Configuration of experimental features."
     )
     config_path: Path = Field()
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     @model_validator(mode="after")
     def validate_install_job_sources(self):  # pylint: disable=E0213
@@ -1,9 +1,11 @@
 from typing import Any, Dict, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class ExperimentalConfig(BaseModel, extra="forbid"):  # type: ignore
+class ExperimentalConfig(BaseModel):  # type: ignore
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
     plan: List[Dict[str, Any]] = Field(
         default_factory=list,
         description="""Optional optimization plan.""",
@@ -1,11 +1,13 @@
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from everest.config.validation_utils import check_writable_filepath
 
 
-class ExportConfig(BaseModel, extra="forbid"):  # type: ignore
+class ExportConfig(BaseModel):  # type: ignore
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
     csv_output_filepath: Optional[str] = Field(
         default=None,
         description="""Specifies which file to write the export to.
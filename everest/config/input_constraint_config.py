@@ -1,9 +1,11 @@
 from typing import Dict, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
-class InputConstraintConfig(BaseModel, extra="forbid"):  # type: ignore
+class InputConstraintConfig(BaseModel):  # type: ignore
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
     weights: Dict[str, float] = Field(
         description="""**Example**
 If we are trying to constrain only one control (i.e the z control) value:
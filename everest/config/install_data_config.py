@@ -1,10 +1,12 @@
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
-class InstallDataConfig(BaseModel, extra="forbid"):  # type: ignore
+class InstallDataConfig(BaseModel):  # type: ignore
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
     source: str = Field(
         description="""
         Path to file or directory that needs to be copied or linked in the evaluation
@@ -1,6 +1,8 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class InstallJobConfig(BaseModel, extra="forbid"):  # type: ignore
+class InstallJobConfig(BaseModel):  # type: ignore
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
     name: str = Field(description="name of the installed job")
     source: str = Field(description="source file of the ert job")
@@ -1,9 +1,11 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class InstallTemplateConfig(BaseModel, extra="forbid"):  # type: ignore
+class InstallTemplateConfig(BaseModel):  # type: ignore
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
     template: str = Field()  # existing file
     output_file: str = Field()  # path
     extra_data: Optional[str] = Field(default=None)  # path
@@ -1,12 +1,21 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, NonNegativeInt, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    NonNegativeInt,
+    field_validator,
+    model_validator,
+)
 
 from everest.strings import DATE_FORMAT
 
 
-class ModelConfig(BaseModel, extra="forbid"):  # type: ignore
+class ModelConfig(BaseModel):  # type: ignore
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
     realizations: List[NonNegativeInt] = Field(
         default_factory=lambda: [],
         description="""List of realizations to use in optimization ensemble.
@@ -1,9 +1,11 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field, PositiveFloat, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PositiveFloat, field_validator
 
 
-class ObjectiveFunctionConfig(BaseModel, extra="forbid"):  # type: ignore
+class ObjectiveFunctionConfig(BaseModel):  # type: ignore
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
     name: str = Field()
     alias: Optional[str] = Field(
         default=None,
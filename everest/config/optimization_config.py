@@ -1,13 +1,15 @@
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from everest.config.cvar_config import CVaRConfig
 from everest.config.restart_config import RestartConfig
 from everest.optimizer.utils import get_ropt_plugin_manager
 
 
-class OptimizationConfig(BaseModel, extra="forbid"):  # type: ignore
+class OptimizationConfig(BaseModel):  # type: ignore
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
     algorithm: Optional[str] = Field(
         default="default",
         description="""Algorithm used by Everest.  Defaults to
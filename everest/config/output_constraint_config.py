@@ -1,9 +1,11 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
-class OutputConstraintConfig(BaseModel, extra="forbid"):  # type: ignore
+class OutputConstraintConfig(BaseModel):  # type: ignore
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
     name: str = Field(description="The unique name of the output constraint.")
     target: Optional[float] = Field(
         default=None,
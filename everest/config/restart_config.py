@@ -36,5 +36,6 @@ exclude results that violate a constraint.
 
     model_config = ConfigDict(
         extra="forbid",
+        defer_build=True,
         metadata={"doc": """Configure optimization restarts."""},
     )
@@ -45,6 +45,7 @@ This dict of values is passed unchanged to the selected method in the backend.
 
     model_config = ConfigDict(
         extra="forbid",
+        defer_build=True,
         metadata={
             "doc": """
 A sampler specification section applies to a group of controls, or to an
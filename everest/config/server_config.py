@@ -40,6 +40,7 @@ as RMS and Eclipse.
     )
     model_config = ConfigDict(
         extra="forbid",
+        defer_build=True,
         metadata={
             "doc": """Defines Everest server settings, i.e., which queue system,
             queue name and queue options are used for the everest server.
@@ -1,11 +1,13 @@
 from typing import Literal, Optional
 
-from pydantic import BaseModel, Field, NonNegativeInt, PositiveInt
+from pydantic import BaseModel, ConfigDict, Field, NonNegativeInt, PositiveInt
 
 from .has_ert_queue_options import HasErtQueueOptions
 
 
-class SimulatorConfig(BaseModel, HasErtQueueOptions, extra="forbid"):  # type: ignore
+class SimulatorConfig(BaseModel, HasErtQueueOptions):  # type: ignore
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
     name: Optional[str] = Field(
         default=None, description="Specifies which queue to use"
     )
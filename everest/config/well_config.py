@@ -23,6 +23,7 @@ consider this as the earliest possible drill date.
     )
     model_config = ConfigDict(
         extra="forbid",
+        defer_build=True,
         metadata={
             "doc": """
     Specification of a well
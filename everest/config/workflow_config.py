@@ -15,4 +15,5 @@ class WorkflowConfig(BaseModel):  # type: ignore
 
     model_config = ConfigDict(
         extra="forbid",
+        defer_build=True,
     )
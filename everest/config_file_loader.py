@@ -2,7 +2,7 @@
 
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 import jinja2
 from ruamel.yaml import YAML, YAMLError
@@ -30,20 +30,23 @@ ERT_CONFIG_TEMPLATES = {
 
 def load_yaml(file_name: str) -> Optional[Dict[str, Any]]:
     with open(file_name, "r", encoding="utf-8") as input_file:
-        input_data: List[str] = input_file.readlines()
-        try:
-            return YAML(typ="safe", pure=True).load("".join(input_data))
-        except YAMLError as exc:
-            if hasattr(exc, "problem_mark"):
-                mark = exc.problem_mark
-                raise YAMLError(
-                    str(exc)
-                    + "\nError in line: {}\n {}^)".format(
-                        input_data[mark.line], " " * mark.column
-                    )
-                ) from exc
-
-        return None
+        return _load_yaml_string(input_file.read())
+
+
+def _load_yaml_string(text: str) -> Optional[Dict[str, Any]]:
+    try:
+        return YAML(typ="safe", pure=True).load(text)
+    except YAMLError as exc:
+        if hasattr(exc, "problem_mark"):
+            mark = exc.problem_mark
+            raise YAMLError(
+                str(exc)
+                + "\nError in line: {}\n {}^)".format(
+                    text.splitlines(keepends=True)[mark.line], " " * mark.column
+                )
+            ) from exc
+
+    return None
 
 
 def _get_definitions(configuration, configpath):
@@ -113,15 +116,15 @@ def _render_definitions(definitions, jinja_env):
 
 
 def yaml_file_to_substituted_config_dict(config_path: str) -> Dict[str, Any]:
-    configuration = load_yaml(config_path)
+    with open(config_path, "r", encoding="utf-8") as f:
+        txt = f.read()
+    configuration = _load_yaml_string(txt)
 
     definitions = _get_definitions(
         configuration=configuration,
         configpath=os.path.dirname(os.path.abspath(config_path)),
     )
     definitions["os"] = _os()  # update definitions with os namespace
-    with open(config_path, "r", encoding="utf-8") as f:
-        txt = "".join(f.readlines())
     jenv = jinja2.Environment(
         block_start_string=BLOCK_START_STRING,
         variable_start_string=VARIABLE_START_STRING,
@@ -85,10 +85,11 @@ def get_forward_models_schemas():
     """
 
 
-@hookspec
+@hookspec(firstresult=True)
 def parse_forward_model_schema(path: str, schema: Type[T]):
     """
     Given a path and schema type, this hook will parse the file.
+    The first plugin returning a result handles the parsing.
     """
 
 
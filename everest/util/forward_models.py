@@ -1,5 +1,6 @@
+from functools import lru_cache
 from itertools import chain
-from typing import Type, TypeVar
+from typing import Any, Dict, Tuple, Type, TypeVar
 
 from pydantic import BaseModel, ValidationError
 
@@ -9,28 +10,24 @@ pm = EverestPluginManager()
 T = TypeVar("T", bound=BaseModel)
 
 
-def collect_forward_models():
-    return chain.from_iterable(pm.hook.get_forward_models())
+@lru_cache(maxsize=None)
+def collect_forward_models() -> Tuple[Dict[str, str], ...]:
+    return tuple(chain.from_iterable(pm.hook.get_forward_models()))
 
 
-def collect_forward_model_schemas():
+@lru_cache(maxsize=None)
+def collect_forward_model_schemas() -> Dict[str, Any]:
     return pm.hook.get_forward_models_schemas().pop()
 
 
 def parse_forward_model_file(path: str, schema: Type[T], message: str) -> T:
     try:
-        res = pm.hook.parse_forward_model_schema(path=path, schema=schema)
-        if res:
-            res.pop()
-        return res
+        return pm.hook.parse_forward_model_schema(path=path, schema=schema)
     except ValidationError as ve:
-        raise ValueError(
-            message.format(
-                error="\n\t\t".join(
-                    f"{error['loc'][0]}: {error['input']} -> {error['msg']}"
-                    for error in ve.errors()
-                )
-            )
-        ) from ve
+        errors = [
+            f"{error['loc'][0]}: {error['input']} -> {error['msg']}"
+            for error in ve.errors()
+        ]
+        raise ValueError(message.format(error="\n\t\t".join(errors))) from ve
     except ValueError as ve:
         raise ValueError(message.format(error=str(ve))) from ve
@@ -1,3 +1,4 @@
+from functools import partialmethod
 from logging import CRITICAL, DEBUG, ERROR, INFO, WARNING
 
 from qtpy.QtWidgets import QMessageBox
@@ -6,27 +7,37 @@ from qtpy.QtWidgets import QMessageBox
 class QtDialogsOut(object):
     """Support output requests through Qt Dialogs"""
 
+    # The QMessageBox functions are given by name, so that they are looked up
+    # when called and can be patched in tests
+    _DISPATCH = {
+        CRITICAL: ("critical", "Critical"),
+        ERROR: ("critical", "Error"),
+        WARNING: ("warning", "Warning"),
+        INFO: ("information", "Information"),
+        DEBUG: ("information", "Debug"),
+    }
+
     def __init__(self, qt_main_window, log_level=WARNING):
         super(QtDialogsOut, self).__init__()
         self._main_window = qt_main_window
         self.log_level = log_level
 
-    def critical(self, message, force=False):
-        if CRITICAL >= self.log_level or force:
-            QMessageBox.critical(self._main_window, "Critical", message)
-
-    def _error(self, message, force=False):
-        if ERROR >= self.log_level or force:
-            QMessageBox.critical(self._main_window, "Error", message)
-
-    def warning(self, message, force=False):
-        if WARNING >= self.log_level or force:
-            QMessageBox.warning(self._main_window, "Warning", message)
-
-    def info(self, message, force=False):
-        if INFO >= self.log_level or force:
-            QMessageBox.information(self._main_window, "Information", message)
-
-    def debug(self, message, force=False):
-        if DEBUG >= self.log_level or force:
-            QMessageBox.information(self._main_window, "Debug", message)
+    @property
+    def log_level(self):
+        return self._log_level
+
+    @log_level.setter
+    def log_level(self, log_level):
+        self._log_level = log_level
+        self._enabled = {level: level >= log_level for level in self._DISPATCH}
+
+    def _emit(self, level, message, force=False):
+        if force or self._enabled[level]:
+            function_name, title = self._DISPATCH[level]
+            getattr(QMessageBox, function_name)(self._main_window, title, message)
+
+    critical = partialmethod(_emit, CRITICAL)
+    _error = partialmethod(_emit, ERROR)
+    warning = partialmethod(_emit, WARNING)
+    info = partialmethod(_emit, INFO)
+    debug = partialmethod(_emit, DEBUG)
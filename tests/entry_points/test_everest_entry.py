@@ -100,6 +100,37 @@ def test_everest_entry_debug(
     assert f'"config_path": "{os.getcwd()}/config_minimal.yml"' in logstream.getvalue()
 
 
+@patch("everest.bin.everest_script.run_detached_monitor")
+@patch("everest.bin.everest_script.wait_for_server")
+@patch("everest.bin.everest_script.start_server")
+@patch(
+    "everest.bin.everest_script.everserver_status",
+    return_value={"status": ServerStatus.never_run, "message": None},
+)
+@tmpdir(CONFIG_PATH)
+def test_everest_entry_debug_non_str_keys(
+    everserver_status_mock,
+    start_server_mock,
+    wait_for_server_mock,
+    start_monitor_mock,
+):
+    """Test that --debug dumps configs with non-string keys in free-form dicts"""
+    with open(CONFIG_FILE_MINIMAL, "r", encoding="utf-8") as f:
+        config = f.read()
+    config = config.replace(
+        "  max_batch_num: 4\n",
+        "  max_batch_num: 4\n  backend_options:\n    options:\n      1: a\n",
+    )
+    with open("config_non_str_keys.yml", "w", encoding="utf-8") as f:
+        f.write(config)
+
+    with capture_logger() as logstream:
+        everest_entry(["config_non_str_keys.yml", "--debug"])
+
+    start_server_mock.assert_called_once()
+    assert '"1": "a"' in logstream.getvalue()
+
+
 @patch("everest.bin.everest_script.run_detached_monitor")
 @patch("everest.bin.everest_script.wait_for_server")
 @patch("everest.bin.everest_script.start_server")
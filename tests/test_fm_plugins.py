@@ -14,6 +14,12 @@ def test_jobs():
         assert "path" in job
 
 
+def test_jobs_can_be_iterated_repeatedly():
+    jobs = collect_forward_models()
+    assert list(jobs) == list(jobs)
+    assert collect_forward_models() is jobs
+
+
 def test_everest_models_jobs():
     pytest.importorskip("everest_models")
     pm = EverestPluginManager()
@@ -48,6 +54,30 @@ def test_multiple_plugins():
         assert value in jobs
 
 
+def test_parse_forward_model_schema_stops_at_first_result():
+    calls = []
+
+    class Plugin1:
+        @hookimpl
+        def parse_forward_model_schema(self, path, schema):
+            calls.append("plugin1")
+            return {"parsed_by": "plugin1"}
+
+    class Plugin2:
+        @hookimpl
+        def parse_forward_model_schema(self, path, schema):
+            calls.append("plugin2")
+            return {"parsed_by": "plugin2"}
+
+    pm = EverestPluginManager(plugins=[Plugin1(), Plugin2()])
+
+    # Plugins registered last are called first
+    assert pm.hook.parse_forward_model_schema(path="foo", schema=dict) == {
+        "parsed_by": "plugin2"
+    }
+    assert calls == ["plugin2"]
+
+
 def test_add_logging_handle():
     pm = EverestPluginManager()
     hook_log_handles = pm.hook.add_log_handle_to_root()
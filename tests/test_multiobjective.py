@@ -1,3 +1,5 @@
+import shutil
+
 import pytest
 from ert.config import ErtConfig
 from ropt.config.enopt import EnOptConfig
@@ -7,14 +9,22 @@ from everest.optimizer.everest2ropt import everest2ropt
 from everest.simulator.everest2res import everest2res
 from everest.suite import _EverestWorkflow
 from tests.test_config_validation import has_error
-from tests.utils import relpath, tmpdir
+from tests.utils import link_or_copy, relpath
 
 CONFIG_DIR = relpath("test_data", "mocked_test_case")
 CONFIG_FILE = "config_multi_objectives.yml"
 
 
-@tmpdir(CONFIG_DIR)
-def test_config_multi_objectives():
+@pytest.fixture
+def mocked_case(tmp_path, monkeypatch):
+    """Enter a hardlinked copy of CONFIG_DIR, the inputs must not be modified"""
+    path = tmp_path / "mocked_test_case"
+    shutil.copytree(CONFIG_DIR, path, copy_function=link_or_copy)
+    monkeypatch.chdir(path)
+    return path
+
+
+def test_config_multi_objectives(mocked_case):
     config = EverestConfig.load_file(CONFIG_FILE)
     config_dict = config.to_dict()
 
@@ -71,40 +81,33 @@ def test_config_multi_objectives():
     _EverestWorkflow(config)
 
 
-@tmpdir(CONFIG_DIR)
-def test_multi_objectives2res():
+def test_multi_objectives2res(mocked_case):
     config = EverestConfig.load_file(CONFIG_FILE)
     res = everest2res(config, site_config=ErtConfig.read_site_config())
     ErtConfig.from_dict(config_dict=res)
 
 
-@tmpdir(CONFIG_DIR)
-def test_multi_objectives2ropt():
+def test_multi_objectives2ropt(mocked_case):
     # pylint: disable=unbalanced-tuple-unpacking
     config = EverestConfig.load_file(CONFIG_FILE)
-    config_dict = config.to_dict()
-    ever_objs = config_dict["objective_functions"]
-    ever_objs[0]["weight"] = 1.33
-    ever_objs[0]["normalization"] = 1
-    ever_objs[1]["weight"] = 3.1
-    assert len(EverestConfig.lint_config_dict(config_dict)) == 0
+    ever_objs = config.objective_functions
+    ever_objs[0].weight = 1.33
+    ever_objs[0].normalization = 1
+    ever_objs[1].weight = 3.1
 
-    norm = ever_objs[0]["weight"] + ever_objs[1]["weight"]
+    norm = ever_objs[0].weight + ever_objs[1].weight
 
-    enopt_config = EnOptConfig.model_validate(
-        everest2ropt(EverestConfig.model_validate(config_dict))
-    )
+    enopt_config = EnOptConfig.model_validate(everest2ropt(config))
     assert len(enopt_config.objective_functions.names) == 2
-    assert enopt_config.objective_functions.names[1] == ever_objs[1]["name"]
-    assert enopt_config.objective_functions.weights[1] == ever_objs[1]["weight"] / norm
-    assert enopt_config.objective_functions.names[0] == ever_objs[0]["name"]
-    assert enopt_config.objective_functions.weights[0] == ever_objs[0]["weight"] / norm
-    assert enopt_config.objective_functions.scales[0] == ever_objs[0]["normalization"]
+    assert enopt_config.objective_functions.names[1] == ever_objs[1].name
+    assert enopt_config.objective_functions.weights[1] == ever_objs[1].weight / norm
+    assert enopt_config.objective_functions.names[0] == ever_objs[0].name
+    assert enopt_config.objective_functions.weights[0] == ever_objs[0].weight / norm
+    assert enopt_config.objective_functions.scales[0] == ever_objs[0].normalization
 
 
 @pytest.mark.integration_test
-@tmpdir(CONFIG_DIR)
-def test_multi_objectives_run():
+def test_multi_objectives_run(mocked_case):
     config = EverestConfig.load_file(CONFIG_FILE)
     workflow = _EverestWorkflow(config)
     workflow.start_optimization()
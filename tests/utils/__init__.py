@@ -1,4 +1,6 @@
 import contextlib
+import errno
+import functools
 import logging
 import os
 import pathlib
@@ -8,8 +10,8 @@ import tempfile
 from io import StringIO
 from unittest import mock
 
-import decorator
 import pytest
+from filelock import FileLock
 
 from everest.bin.main import start_everest
 from everest.config import EverestConfig
@@ -40,11 +42,12 @@ def skipif_no_simulator(function):
 def hide_opm(function):
     """Decorator for faking that the opm module is not present"""
 
-    def wrapper(function, *args, **kwargs):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
         with mock.patch("everest.util.has_opm", return_value=False):
             return function(*args, **kwargs)
 
-    return decorator.decorator(wrapper, function)
+    return wrapper
 
 
 def relpath(*path):
@@ -55,15 +58,29 @@ def tmpdir(path, teardown=True):
     """Decorator based on the  `tmp` context"""
 
     def real_decorator(function):
-        def wrapper(function, *args, **kwargs):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
             with tmp(path, teardown=teardown):
                 return function(*args, **kwargs)
 
-        return decorator.decorator(wrapper, function)
+        return wrapper
 
     return real_decorator
 
 
+def link_or_copy(src, dst):
+    """Hardlink src to dst, falling back to a copy if hardlinks are not possible
+
+    This is the case across devices, or on filesystems without hardlinks.
+    """
+    try:
+        os.link(src, dst)
+    except OSError as err:
+        if err.errno not in (errno.EXDEV, errno.EPERM, errno.ENOTSUP):
+            raise
+        shutil.copy2(src, dst)
+
+
 @contextlib.contextmanager
 def tmp(path=None, teardown=True):
     """Create and go into tmp directory, returns the path.
@@ -185,32 +202,37 @@ class MockParser(object):
         self.error_msg = value
 
 
+_SCRIPT_REL_PATHS = [
+    (script_name, os.path.join(".jobs", "_%s" % script_name))
+    for script_name in script_names
+]
+
+
 def everest_default_jobs(output_dir):
     return [
-        (
-            script_name,
-            os.path.join(output_dir, ".jobs", "_%s" % script_name),
-        )
-        for script_name in script_names
+        (script_name, os.path.join(output_dir, rel_path))
+        for script_name, rel_path in _SCRIPT_REL_PATHS
     ] + [(job["name"], job["path"]) for job in collect_forward_models()]
 
 
 def create_cached_mocked_test_case(request, monkeypatch) -> pathlib.Path:
     """This function will run everest to create some mocked data,
-    this is quite slow, but the results will be cached. If something comes
-    out of sync, clear the cache and start again. (rm -fr .pytest_cache/)
+    this is quite slow, but the results will be cached and shared between
+    pytest-xdist workers. If something comes out of sync, clear the cache and
+    start again. (rm -fr .pytest_cache/)
     """
     config_file = "mocked_multi_batch.yml"
     config_path = relpath("test_data", "mocked_test_case")
-    cache_path = request.config.cache.mkdir(
-        "snake_oil_data" + os.environ.get("PYTEST_XDIST_WORKER", "")
-    )
-    if not os.path.exists(cache_path / "mocked_run"):
-        monkeypatch.chdir(cache_path)
-        shutil.copytree(config_path, "mocked_run")
-        monkeypatch.chdir("mocked_run")
-        start_everest(["everest", "run", config_file])
-        config = EverestConfig.load_file(config_file)
-        status = everserver_status(config)
-        assert status["status"] == ServerStatus.completed
+    cache_path = request.config.cache.mkdir("snake_oil_data")
+    # The cache is shared between pytest-xdist workers, only one of them
+    # should run everest while the others wait for the result
+    with FileLock(cache_path / "mocked_run.lock"):
+        if not os.path.exists(cache_path / "mocked_run"):
+            monkeypatch.chdir(cache_path)
+            shutil.copytree(config_path, "mocked_run")
+            monkeypatch.chdir("mocked_run")
+            start_everest(["everest", "run", config_file])
+            config = EverestConfig.load_file(config_file)
+            status = everserver_status(config)
+            assert status["status"] == ServerStatus.completed
     return cache_path / "mocked_run"